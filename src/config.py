@@ -17,11 +17,31 @@ class WatchInputConfig:
     # Threshold for detecting significant orientation change
     orientation_change_threshold: float = 5.0
     
+    # Motion smoothing: how many recent orientation samples vote on the
+    # motion command, and how many votes are needed to start moving / to stop.
+    # Stopping needs fewer votes so the robot halts promptly.
+    motion_vote_window: int = 8
+    motion_vote_threshold: int = 5
+    stop_vote_threshold: int = 4
+    
     # Debounce time for gesture recognition (milliseconds)
     gesture_debounce_ms: int = 200
     
     # Connection timeout (seconds)
     connection_timeout_s: float = 5.0
+    
+    def __post_init__(self):
+        # A threshold above the window can never be reached, so the robot
+        # would never move (or never stop)
+        if self.motion_vote_window < 1:
+            raise ValueError("motion_vote_window must be at least 1")
+        for name in ("motion_vote_threshold", "stop_vote_threshold"):
+            votes = getattr(self, name)
+            if not 1 <= votes <= self.motion_vote_window:
+                raise ValueError(
+                    f"{name} must be between 1 and motion_vote_window "
+                    f"({self.motion_vote_window}), got {votes}"
+                )
 
 
 @dataclass
@@ -50,15 +70,19 @@ class AppConfig:
     
     # Heartbeat log interval in seconds (0 to disable)
     heartbeat_interval_s: float = 0.0
+    
+    # Raise OS scheduling priority of the control loop (best effort)
+    realtime: bool = False
 
 
-def get_default_config(mock_mode: bool = True, verbose: bool = False) -> AppConfig:
+def get_default_config(mock_mode: bool = True, verbose: bool = False, realtime: bool = False) -> AppConfig:
     """
     Get the default application configuration.
     
     Args:
         mock_mode: Whether to run in mock/dry-run mode
         verbose: Whether to enable verbose logging
+        realtime: Whether to request real-time scheduling priority
     
     Returns:
         AppConfig with sensible defaults
@@ -69,4 +93,5 @@ def get_default_config(mock_mode: bool = True, verbose: bool = False) -> AppConf
         mock_mode=mock_mode,
         verbose=verbose,
         heartbeat_interval_s=5.0 if verbose else 0.0,
+        realtime=realtime,
     )
@@ -9,6 +9,11 @@ from src.interpreter.watch_interpreter import WatchInterpreter
 from src.robot.backend import RobotBackend
 from src.utils.commands import MotionCommand, ActionCommand, RobotCommand
 from src.utils.logger import Logger
+from src.utils.rt import enable_realtime, windows_high_res_timer
+
+
+# One shared command per motion; commands are never mutated after creation
+_MOTION_TO_COMMAND = {m: RobotCommand(motion=m) for m in MotionCommand}
 
 
 class ManualController:
@@ -49,7 +54,10 @@ class ManualController:
         
         self._running = False
         self._last_command: 'RobotCommand | None' = None
+        self._last_motion_sent: 'MotionCommand | None' = None
         self._last_heartbeat = 0.0
+        self._last_seen_seq: 'int | None' = None
+        self._current_motion: 'MotionCommand | None' = None
     
     def connect(self) -> bool:
         """
@@ -89,35 +97,50 @@ class ManualController:
         Raises:
             ConnectionError: If watch disconnects
         """
+        watch_input = self.watch_input
+        interpreter = self.interpreter
+        
         try:
-            self.watch_input.poll()
+            watch_input.poll()
         except Exception as e:
             self.logger.error("watch", f"Poll error: {e}")
             raise ConnectionError("Watch disconnected") from e
         
-        if not self.watch_input.is_connected():
+        if not watch_input.is_connected():
             raise ConnectionError("Watch disconnected")
         
-        # Get current orientation and interpret it
-        orientation = self.watch_input.get_orientation()
+        # Get current orientation and interpret it. The sequence number is
+        # read first so a sample published in between is not skipped.
+        seq = watch_input.get_orientation_seq()
+        orientation = watch_input.get_orientation()
         if orientation is None:
             return
         
-        new_motion = self.interpreter.interpret_orientation(orientation)
+        if seq is None or seq != self._last_seen_seq:
+            self._last_seen_seq = seq
+            new_motion = interpreter.interpret_orientation(orientation)
+            self._current_motion = new_motion
+            motion_changed = interpreter.get_command_change(new_motion)
+        else:
+            # No new sample since the last poll, so nothing to re-interpret
+            new_motion = self._current_motion
+            motion_changed = False
         
         # Check if motion command changed
-        if self.interpreter.get_command_change(new_motion):
+        if motion_changed:
             if new_motion:
-                cmd = RobotCommand(motion=new_motion)
-                self._execute_command(cmd)
+                self._execute_command(_MOTION_TO_COMMAND[new_motion])
         elif self._should_emit_heartbeat():
             if new_motion:
-                self.logger.debug("heartbeat", f"Current motion: {new_motion.name}")
-        
-        # Check for gestures
-        gesture = self.watch_input.get_gesture()
-        if gesture:
-            action = self.interpreter.interpret_gesture(gesture)
+                self.logger.debug_lazy("heartbeat", lambda: f"Current motion: {new_motion.name}")
+        
+        # Drain every gesture that arrived since the last poll
+        get_gesture = watch_input.get_gesture
+        while True:
+            gesture = get_gesture()
+            if gesture is None:
+                break
+            action = interpreter.interpret_gesture(gesture)
             if action:
                 cmd = RobotCommand(action=action)
                 self._execute_command(cmd)
@@ -129,8 +152,12 @@ class ManualController:
         Args:
             cmd: RobotCommand to execute
         """
-        if cmd.motion:
-            self.robot_backend.execute_motion(cmd.motion)
+        # Skip re-sending the motion the backend is already executing.
+        # Actions are one-shot events and are always dispatched.
+        motion = cmd.motion
+        if motion is not None and motion is not self._last_motion_sent:
+            self.robot_backend.execute_motion(motion)
+            self._last_motion_sent = motion
         
         if cmd.action:
             self.robot_backend.execute_action(cmd.action)
@@ -151,19 +178,43 @@ class ManualController:
         if not self.connect():
             raise RuntimeError("Failed to connect to watch")
         
+        # After connect(), so the watch SDK's own threads keep default priority
+        if self.config.realtime:
+            if enable_realtime():
+                self.logger.info("controller", "Real-time scheduling enabled")
+            else:
+                self.logger.warning("controller", "Real-time scheduling unavailable, using default priority")
+        
         self._running = True
         self.logger.info("controller", "Manual control system started")
         
+        # Bind hot-loop callables once instead of resolving them every tick
+        process = self._process_watch_data
+        sleep = time.sleep
+        stop_all = self.robot_backend.stop_all
+        monotonic = time.monotonic
+        
+        # Schedule polls against a monotonic deadline so the period does not
+        # drift by the time spent processing each tick
+        next_deadline = monotonic()
+        
         try:
-            while self._running:
-                try:
-                    self._process_watch_data()
-                except ConnectionError:
-                    self.logger.error("controller", "Watch disconnected, stopping robot")
-                    self.robot_backend.stop_all()
-                    break
-                
-                time.sleep(poll_interval_s)
+            with windows_high_res_timer():
+                while self._running:
+                    try:
+                        process()
+                    except ConnectionError:
+                        self.logger.error("controller", "Watch disconnected, stopping robot")
+                        stop_all()
+                        break
+                    
+                    next_deadline += poll_interval_s
+                    delay = next_deadline - monotonic()
+                    if delay > 0:
+                        sleep(delay)
+                    else:
+                        # Overran the slot: skip to the next one instead of bursting
+                        next_deadline = monotonic()
         
         except KeyboardInterrupt:
             self.logger.info("controller", "Shutdown signal received")
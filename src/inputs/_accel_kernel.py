@@ -0,0 +1,31 @@
+"""
+Numeric kernel for the accelerometer orientation fallback.
+
+JIT-compiled with numba when it is installed (useful when the SDK streams
+accelerometer-only payloads at a high rate); plain Python otherwise.
+"""
+
+from math import atan2, sqrt
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# 180 / pi
+_RAD2DEG = 57.29577951308232
+
+
+def _accel_to_roll_pitch(ax: float, ay: float, az: float) -> tuple[float, float]:
+    """Simple gravity-based roll/pitch estimate in degrees."""
+    roll = atan2(ax, az if abs(az) > 1e-6 else 1e-6) * _RAD2DEG
+    pitch = atan2(ay, sqrt(ax * ax + az * az)) * _RAD2DEG
+    return roll, pitch
+
+
+if njit is not None:
+    # Eager signature: compile at import, not on the first call from the
+    # SDK sensor callback (which would stall the BLE thread)
+    accel_to_roll_pitch = njit("UniTuple(float64, 2)(float64, float64, float64)", cache=True)(_accel_to_roll_pitch)
+else:
+    accel_to_roll_pitch = _accel_to_roll_pitch
@@ -4,13 +4,14 @@ Real watch input source.
 This bridges a real watch SDK into the existing WatchInputSource interface.
 """
 
-import math
 import threading
 import time
 from collections import deque
+from math import asin, atan2
 from typing import Optional, Any
 
-from src.inputs.watch_input import WatchInputSource, WatchOrientation, WatchGesture
+from src.inputs.watch_input import WatchInputSource, WatchOrientation, WatchGesture, now_ms
+from src.inputs._accel_kernel import accel_to_roll_pitch
 
 try:
     from touch_sdk import Watch as TouchSDKWatch
@@ -18,96 +19,211 @@ except Exception:
     TouchSDKWatch = None
 
 
-def _read_value(obj: Any, *names: str) -> Any:
-    """Read a value from an object or dict using multiple possible field names."""
+# Resolved payload layout per SDK sensor type: (mode, field names, part names,
+# absent names). mode is "roll_pitch", "quat" or "accel"; field names are the
+# top-level fields to read, and part names the w/x/y/z or x/y/z fields inside
+# the nested quaternion/accelerometer payload (empty for a [w, x, y, z]
+# sequence). Absent names are the higher-priority fields whose absence let the
+# layout be cached; if one of them shows up, the payload is probed again.
+_SENSOR_ACCESSOR_CACHE: dict[type, tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = {}
+
+# Field names tried for each quaternion and accelerometer component
+_QUAT_PART_NAMES = (("w", "qw", "q0"), ("x", "qx", "q1"), ("y", "qy", "q2"), ("z", "qz", "q3"))
+_ACCEL_PART_NAMES = (("x", "ax"), ("y", "ay"), ("z", "az"))
+
+# Gesture names that mean "nothing happened"
+_IGNORE_GESTURES = frozenset({"", "none", "null", "idle", "no_gesture", "unknown"})
+
+# Lowercased SDK gesture name -> name passed to the interpreter. Seeded with
+# the known tap-like names and filled in lazily with other tap-like ones.
+_GESTURE_CANON: dict[str, str] = {
+    "tap": "tap",
+    "pinch": "tap",
+    "doubletap": "tap",
+    "double_tap": "tap",
+}
+
+# 180 / pi, applied as a multiply instead of calling math.degrees
+_RAD2DEG = 57.29577951308232
+
+
+def _resolve_name(obj: Any, *names: str) -> Optional[str]:
+    """Return the first of several possible field names present on an object or dict."""
     if obj is None:
         return None
 
     if isinstance(obj, dict):
         for name in names:
             if name in obj:
-                return obj[name]
+                return name
         return None
 
     for name in names:
         if hasattr(obj, name):
-            return getattr(obj, name)
+            return name
 
     return None
 
 
-def _extract_quaternion_parts(q: Any) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
-    """Try to extract quaternion parts as w, x, y, z."""
-    if q is None:
-        return None, None, None, None
+def _read_known(obj: Any, name: str) -> Any:
+    """Read a single, already-resolved field from an object or dict."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
 
-    if isinstance(q, (list, tuple)) and len(q) == 4:
-        # Assume [w, x, y, z]
-        return float(q[0]), float(q[1]), float(q[2]), float(q[3])
 
-    w = _read_value(q, "w", "qw", "q0")
-    x = _read_value(q, "x", "qx", "q1")
-    y = _read_value(q, "y", "qy", "q2")
-    z = _read_value(q, "z", "qz", "q3")
+def _resolve_parts(obj: Any, candidates: tuple[tuple[str, ...], ...]) -> Optional[tuple[str, ...]]:
+    """Resolve one field name per component, or None if any component is missing."""
+    parts = []
+    for names in candidates:
+        name = _resolve_name(obj, *names)
+        if name is None:
+            return None
+        parts.append(name)
+    return tuple(parts)
 
-    if None not in (w, x, y, z):
-        return float(w), float(x), float(y), float(z)
 
-    return None, None, None, None
+def _read_parts(obj: Any, parts: tuple[str, ...]) -> Optional[list[float]]:
+    """Read already-resolved component fields as floats, or None if any is empty."""
+    values = []
+    for name in parts:
+        value = _read_known(obj, name)
+        if value is None:
+            return None
+        values.append(float(value))
+    return values
 
 
 def _quat_to_roll_pitch_deg(w: float, x: float, y: float, z: float) -> tuple[float, float]:
     """Convert quaternion to roll and pitch in degrees."""
     sinr_cosp = 2.0 * (w * x + y * z)
     cosr_cosp = 1.0 - 2.0 * (x * x + y * y)
-    roll = math.degrees(math.atan2(sinr_cosp, cosr_cosp))
+    roll = atan2(sinr_cosp, cosr_cosp) * _RAD2DEG
 
     sinp = 2.0 * (w * y - z * x)
-    sinp = max(-1.0, min(1.0, sinp))
-    pitch = math.degrees(math.asin(sinp))
+    if sinp > 1.0:
+        sinp = 1.0
+    elif sinp < -1.0:
+        sinp = -1.0
+    pitch = asin(sinp) * _RAD2DEG
 
     return roll, pitch
 
 
-def _extract_orientation(sensors: Any) -> Optional[WatchOrientation]:
+def _orientation_from_layout(
+    sensors: Any,
+    mode: str,
+    fields: tuple[str, ...],
+    parts: tuple[str, ...],
+) -> Optional[tuple[float, float]]:
+    """Read (roll, pitch) using a previously resolved payload layout."""
+    if mode == "roll_pitch":
+        roll = _read_known(sensors, fields[0])
+        pitch = _read_known(sensors, fields[1])
+        if roll is None or pitch is None:
+            return None
+        return float(roll), float(pitch)
+
+    payload = _read_known(sensors, fields[0])
+    if payload is None:
+        return None
+
+    if mode == "quat" and not parts:
+        # Quaternion sent as a [w, x, y, z] sequence
+        if isinstance(payload, (list, tuple)) and len(payload) == 4:
+            return _quat_to_roll_pitch_deg(float(payload[0]), float(payload[1]), float(payload[2]), float(payload[3]))
+        return None
+
+    values = _read_parts(payload, parts)
+    if values is None:
+        return None
+
+    if mode == "quat":
+        return _quat_to_roll_pitch_deg(*values)
+    return accel_to_roll_pitch(*values)
+
+
+def _probe_orientation(sensors: Any) -> Optional[tuple[float, float]]:
     """
     Try several common ways to get roll/pitch from the SDK sensor payload.
+
+    Layouts are tried in priority order: roll/pitch, quaternion, accelerometer.
+    The one that works is remembered for the payload's type only if every
+    higher-priority layout was ruled out by missing fields. A field that is
+    present but empty (e.g. a quaternion that is not streaming yet) keeps the
+    type uncached, so the better source takes over once it has data.
     """
+    cacheable = True
+    absent: tuple[str, ...] = ()
 
     # Case 1: direct roll/pitch on sensors
-    roll = _read_value(sensors, "roll")
-    pitch = _read_value(sensors, "pitch")
-    if roll is not None and pitch is not None:
-        return WatchOrientation(roll=float(roll), pitch=float(pitch))
+    roll_name = _resolve_name(sensors, "roll")
+    pitch_name = _resolve_name(sensors, "pitch")
+    if roll_name is not None and pitch_name is not None:
+        layout = ("roll_pitch", (roll_name, pitch_name), ())
+        orientation = _orientation_from_layout(sensors, *layout)
+        if orientation is not None:
+            _SENSOR_ACCESSOR_CACHE[type(sensors)] = (*layout, absent)
+            return orientation
+        cacheable = False
+    else:
+        absent += ("roll",) if roll_name is None else ("pitch",)
 
     # Case 2: quaternion nested under sensors.orientation
-    q = _read_value(sensors, "orientation", "quaternion")
-    w, x, y, z = _extract_quaternion_parts(q)
-    if None not in (w, x, y, z):
-        roll_deg, pitch_deg = _quat_to_roll_pitch_deg(w, x, y, z)
-        return WatchOrientation(roll=roll_deg, pitch=pitch_deg)
+    q_name = _resolve_name(sensors, "orientation", "quaternion")
+    if q_name is None:
+        absent += ("orientation", "quaternion")
+    else:
+        q = _read_known(sensors, q_name)
+        if isinstance(q, (list, tuple)):
+            q_parts: Optional[tuple[str, ...]] = ()
+        else:
+            q_parts = _resolve_parts(q, _QUAT_PART_NAMES)
+        if q_parts is not None:
+            layout = ("quat", (q_name,), q_parts)
+            orientation = _orientation_from_layout(sensors, *layout)
+            if orientation is not None:
+                if cacheable:
+                    _SENSOR_ACCESSOR_CACHE[type(sensors)] = (*layout, absent)
+                return orientation
+        cacheable = False
 
     # Case 3: accelerometer fallback
-    accel = _read_value(sensors, "accel", "accelerometer")
-    if accel is not None:
-        ax = _read_value(accel, "x", "ax")
-        ay = _read_value(accel, "y", "ay")
-        az = _read_value(accel, "z", "az")
-        if None not in (ax, ay, az):
-            ax = float(ax)
-            ay = float(ay)
-            az = float(az)
-
-            # Simple gravity-based estimate
-            roll_deg = math.degrees(math.atan2(ax, az if abs(az) > 1e-6 else 1e-6))
-            pitch_deg = math.degrees(math.atan2(ay, math.sqrt(ax * ax + az * az)))
-            return WatchOrientation(roll=roll_deg, pitch=pitch_deg)
+    accel_name = _resolve_name(sensors, "accel", "accelerometer")
+    accel = _read_known(sensors, accel_name) if accel_name is not None else None
+    accel_parts = _resolve_parts(accel, _ACCEL_PART_NAMES)
+    if accel_parts is not None:
+        layout = ("accel", (accel_name,), accel_parts)
+        orientation = _orientation_from_layout(sensors, *layout)
+        if orientation is not None:
+            if cacheable:
+                _SENSOR_ACCESSOR_CACHE[type(sensors)] = (*layout, absent)
+            return orientation
 
     return None
 
 
+def _extract_orientation(sensors: Any) -> Optional[tuple[float, float]]:
+    """
+    Get (roll, pitch) in degrees from the SDK sensor payload.
+
+    Uses the layout cached for this payload type when there is one and no
+    higher-priority field has appeared since, and falls back to probing on a
+    cache miss or when the cached fields are empty.
+    """
+    entry = _SENSOR_ACCESSOR_CACHE.get(type(sensors))
+    if entry is not None:
+        mode, fields, parts, absent = entry
+        if _resolve_name(sensors, *absent) is None:
+            orientation = _orientation_from_layout(sensors, mode, fields, parts)
+            if orientation is not None:
+                return orientation
+
+    return _probe_orientation(sensors)
+
+
 def _normalize_gesture_name(gesture: Any) -> str:
-    """Convert gesture enum/object/string into a normalized string."""
+    """Convert gesture enum/object/string into a normalized lowercase string."""
     if gesture is None:
         return ""
 
@@ -118,11 +234,18 @@ def _normalize_gesture_name(gesture: Any) -> str:
     name = name.strip().lower()
 
     # Ignore empty / idle / no-op gesture events
-    if name in ("", "none", "null", "idle", "no_gesture", "unknown"):
+    if name in _IGNORE_GESTURES:
         return ""
 
-    # Normalize common tap-like names into the existing interpreter input
+    canon = _GESTURE_CANON.get(name)
+    if canon is not None:
+        return canon
+
+    # Normalize common tap-like names into the existing interpreter input.
+    # Only tap-like matches are remembered: other names (which may come from
+    # str() of an arbitrary object) would grow the table without bound.
     if "tap" in name or "pinch" in name:
+        _GESTURE_CANON[name] = "tap"
         return "tap"
 
     return name
@@ -131,6 +254,9 @@ def _normalize_gesture_name(gesture: Any) -> str:
 class DoublepointWatchInput(WatchInputSource):
     """Real watch input adapter."""
 
+    # Number of sensor samples averaged to define the neutral wrist pose
+    CALIBRATION_N = 20
+
     def __init__(self, verbose: bool = False, connection_timeout_s: float = 8.0):
         self._verbose = verbose
         self._connection_timeout_s = connection_timeout_s
@@ -139,10 +265,18 @@ class DoublepointWatchInput(WatchInputSource):
         self._started = False
         self._connect_error: Optional[Exception] = None
 
+        # Shared with the SDK callback thread without a lock. Every packet
+        # writes roll and pitch in place into _orientation_buf, the same object
+        # get_orientation() hands out, so a reader can see roll and pitch from
+        # adjacent packets (harmless at sensor rates) and should not hold on to
+        # it across polls. The gesture deque is safe because append/popleft are
+        # atomic in CPython (one producer, one consumer).
         self._orientation: Optional[WatchOrientation] = None
+        # Reused for every packet; published as self._orientation after the first
+        self._orientation_buf = WatchOrientation(roll=0.0, pitch=0.0)
+        self._orientation_seq = 0
         self._gesture_queue: deque[WatchGesture] = deque()
 
-        self._lock = threading.Lock()
         self._thread: Optional[threading.Thread] = None
         self._sdk_watch = None
         self._saw_first_sensor_packet = False
@@ -150,9 +284,15 @@ class DoublepointWatchInput(WatchInputSource):
 
         self._roll_offset = 0.0
         self._pitch_offset = 0.0
-        self._calibration_samples = []
+        self._roll_sum = 0.0
+        self._pitch_sum = 0.0
+        self._sample_count = 0
         self._is_calibrated = False
 
+        # SDK sensor callback; swapped to _handle_sensors_running once the
+        # neutral pose is calibrated, so the steady state skips that check
+        self._handle_sensors = self._handle_sensors_calibrating
+
     def connect(self) -> bool:
         if TouchSDKWatch is None:
             raise RuntimeError(
@@ -180,8 +320,8 @@ class DoublepointWatchInput(WatchInputSource):
         self._thread = threading.Thread(target=_runner, daemon=True)
         self._thread.start()
 
-        deadline = time.time() + self._connection_timeout_s
-        while time.time() < deadline:
+        deadline = time.monotonic() + self._connection_timeout_s
+        while time.monotonic() < deadline:
             if self._connect_error is not None:
                 raise RuntimeError(f"Watch connection failed: {self._connect_error}")
             if self._is_calibrated:
@@ -213,14 +353,15 @@ class DoublepointWatchInput(WatchInputSource):
         return self._connected
 
     def get_orientation(self) -> Optional[WatchOrientation]:
-        with self._lock:
-            return self._orientation
+        return self._orientation
+
+    def get_orientation_seq(self) -> Optional[int]:
+        return self._orientation_seq
 
     def get_gesture(self) -> Optional[WatchGesture]:
-        with self._lock:
-            if not self._gesture_queue:
-                return None
-            return self._gesture_queue.popleft()
+        if not self._gesture_queue:
+            return None
+        return self._gesture_queue.popleft()
 
     def poll(self) -> None:
         if self._connect_error is not None:
@@ -229,39 +370,52 @@ class DoublepointWatchInput(WatchInputSource):
         if self._thread is not None and not self._thread.is_alive() and not self._connected:
             raise ConnectionError("Watch thread stopped")
 
-    def _handle_sensors(self, sensors: Any) -> None:
+    def _handle_sensors_calibrating(self, sensors: Any) -> None:
         orientation = _extract_orientation(sensors)
 
         if orientation is None:
             return
 
+        roll, pitch = orientation
+
         # Collect initial samples to define neutral wrist pose
-        if not self._is_calibrated:
-            self._calibration_samples.append((orientation.roll, orientation.pitch))
+        self._roll_sum += roll
+        self._pitch_sum += pitch
+        self._sample_count += 1
 
-            if len(self._calibration_samples) >= 20:
-                avg_roll = sum(r for r, _ in self._calibration_samples) / len(self._calibration_samples)
-                avg_pitch = sum(p for _, p in self._calibration_samples) / len(self._calibration_samples)
+        if self._sample_count >= self.CALIBRATION_N:
+            self._roll_offset = self._roll_sum / self._sample_count
+            self._pitch_offset = self._pitch_sum / self._sample_count
+            self._is_calibrated = True
+            self._handle_sensors = self._handle_sensors_running
 
-                self._roll_offset = avg_roll
-                self._pitch_offset = avg_pitch
-                self._is_calibrated = True
+            if self._verbose:
+                print(
+                    f"[DoublepointWatch] Calibrated neutral pose: "
+                    f"roll_offset={self._roll_offset:.1f}, pitch_offset={self._pitch_offset:.1f}"
+                )
 
-                if self._verbose:
-                    print(
-                        f"[DoublepointWatch] Calibrated neutral pose: "
-                        f"roll_offset={self._roll_offset:.1f}, pitch_offset={self._pitch_offset:.1f}"
-                    )
-
-        corrected = WatchOrientation(
-            roll=orientation.roll - self._roll_offset,
-            pitch=orientation.pitch - self._pitch_offset,
-        )
+        self._publish_orientation(roll, pitch)
+
+    def _handle_sensors_running(self, sensors: Any) -> None:
+        orientation = _extract_orientation(sensors)
+
+        if orientation is not None:
+            self._publish_orientation(*orientation)
+
+    def _publish_orientation(self, roll: float, pitch: float) -> None:
+        # Update the shared instance in place rather than allocating per
+        # packet (see the note in __init__ on what readers may observe)
+        corrected = self._orientation_buf
+        corrected.roll = roll - self._roll_offset
+        corrected.pitch = pitch - self._pitch_offset
 
-        with self._lock:
-            self._orientation = corrected
-            self._saw_first_sensor_packet = True
-            self._connected = True
+        # Publish the sample before bumping the sequence number, so a reader
+        # that sees the new number sees this sample or a later one
+        self._orientation = corrected
+        self._orientation_seq += 1
+        self._saw_first_sensor_packet = True
+        self._connected = True
 
         if self._verbose and not self._printed_first_sensor_debug:
             self._printed_first_sensor_debug = True
@@ -274,11 +428,10 @@ class DoublepointWatchInput(WatchInputSource):
 
         event = WatchGesture(
             gesture_type=gesture_name,
-            timestamp_ms=int(time.time() * 1000),
+            timestamp_ms=now_ms(),
         )
 
-        with self._lock:
-            self._gesture_queue.append(event)
+        self._gesture_queue.append(event)
 
         if self._verbose:
             print(f"[DoublepointWatch] Gesture: {gesture_name}")
\ No newline at end of file
@@ -4,8 +4,9 @@ Mock watch input source for testing without real hardware.
 
 import time
 import random
+from collections import deque
 from typing import Optional
-from src.inputs.watch_input import WatchInputSource, WatchOrientation, WatchGesture
+from src.inputs.watch_input import WatchInputSource, WatchOrientation, WatchGesture, now_ms
 
 
 class MockWatchInput(WatchInputSource):
@@ -21,8 +22,9 @@ class MockWatchInput(WatchInputSource):
         self._connected = False
         self._verbose = verbose
         self._orientation = WatchOrientation(roll=0.0, pitch=0.0)
+        self._orientation_seq = 0
         self._last_gesture_time = 0
-        self._gesture_queue: list = []
+        self._gesture_queue: deque[WatchGesture] = deque()
         self._last_poll_time = time.time()
     
     def connect(self) -> bool:
@@ -48,11 +50,15 @@ class MockWatchInput(WatchInputSource):
             return None
         return self._orientation
     
+    def get_orientation_seq(self) -> Optional[int]:
+        """Get the orientation update counter."""
+        return self._orientation_seq
+    
     def get_gesture(self) -> Optional[WatchGesture]:
         """Get and remove the next gesture from the queue."""
         if not self._connected or not self._gesture_queue:
             return None
-        return self._gesture_queue.pop(0)
+        return self._gesture_queue.popleft()
     
     def poll(self) -> None:
         """
@@ -72,6 +78,7 @@ class MockWatchInput(WatchInputSource):
         # Clamp to reasonable range
         self._orientation.roll = max(-90, min(90, self._orientation.roll))
         self._orientation.pitch = max(-90, min(90, self._orientation.pitch))
+        self._orientation_seq += 1
     
     def inject_orientation(self, roll: float, pitch: float) -> None:
         """
@@ -81,7 +88,9 @@ class MockWatchInput(WatchInputSource):
             roll: Roll angle in degrees
             pitch: Pitch angle in degrees
         """
-        self._orientation = WatchOrientation(roll=roll, pitch=pitch)
+        self._orientation.roll = roll
+        self._orientation.pitch = pitch
+        self._orientation_seq += 1
     
     def inject_gesture(self, gesture_type: str) -> None:
         """
@@ -91,8 +100,8 @@ class MockWatchInput(WatchInputSource):
             gesture_type: Type of gesture (e.g., "tap")
         """
         gesture = WatchGesture(
-            gesture_type=gesture_type,
-            timestamp_ms=int(time.time() * 1000)
+            gesture_type=gesture_type.lower(),
+            timestamp_ms=now_ms()
         )
         self._gesture_queue.append(gesture)
         if self._verbose:
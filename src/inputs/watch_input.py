@@ -2,11 +2,17 @@
 Watch input interfaces and implementations.
 """
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
 
+def now_ms() -> int:
+    """Current monotonic time in milliseconds, for gesture timestamps."""
+    return time.monotonic_ns() // 1_000_000
+
+
 @dataclass
 class WatchOrientation:
     """
@@ -17,13 +23,23 @@ class WatchOrientation:
     - pitch: forward-backward tilt
     """
     
+    __slots__ = ("roll", "pitch")
+    
     roll: float
     pitch: float
 
 
 @dataclass
 class WatchGesture:
-    """Represents a detected gesture on the watch."""
+    """
+    Represents a detected gesture on the watch.
+    
+    gesture_type is always a normalized lowercase name (e.g. "tap").
+    timestamp_ms comes from now_ms(): monotonic, so only differences
+    between timestamps are meaningful (not wall-clock time).
+    """
+    
+    __slots__ = ("gesture_type", "timestamp_ms")
     
     gesture_type: str
     timestamp_ms: int
@@ -62,6 +78,18 @@ class WatchInputSource(ABC):
         """
         pass
     
+    def get_orientation_seq(self) -> Optional[int]:
+        """
+        Get a counter that increases each time a new orientation is published.
+        
+        Read it before get_orientation(): an unchanged value means the
+        orientation has not changed since the last read.
+        
+        Returns:
+            Sequence number, or None if this source does not track one
+        """
+        return None
+    
     @abstractmethod
     def get_gesture(self) -> Optional[WatchGesture]:
         """
@@ -2,12 +2,31 @@
 Interpreter layer: converts raw watch data into semantic commands.
 """
 
+from collections import deque
+
 from src.config import WatchInputConfig
 from src.inputs.watch_input import WatchOrientation, WatchGesture
-from src.utils.commands import MotionCommand, ActionCommand
+from src.utils.commands import (
+    MotionCommand,
+    ActionCommand,
+    MOVE_FORWARD,
+    MOVE_BACKWARD,
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    STOP,
+    PICKUP,
+)
 from src.utils.logger import Logger
 
 
+# Dominant-axis lookups, indexed by whether the tilt is positive
+_ROLL_TABLE = (MOVE_LEFT, MOVE_RIGHT)
+_PITCH_TABLE = (MOVE_BACKWARD, MOVE_FORWARD)
+
+# Gesture types (already lowercase from the input layer) that trigger pickup
+_PICKUP_GESTURES = frozenset({"tap", "double_tap"})
+
+
 class WatchInterpreter:
     """
     Converts watch orientation and gestures into motion and action commands.
@@ -24,46 +43,60 @@ class WatchInterpreter:
         self.config = config
         self.logger = logger
         self._last_motion_command: 'MotionCommand | None' = None
+        self._vote_buffer: deque[MotionCommand] = deque(maxlen=config.motion_vote_window)
+        self._committed_motion: 'MotionCommand | None' = None
+        # Monotonic ms (see WatchGesture.timestamp_ms); only used as a delta
         self._last_gesture_time: int = 0
     
     def interpret_orientation(self, orientation: WatchOrientation) -> 'MotionCommand | None':
         """
         Interpret watch orientation into a motion command.
         
-        Implements dead zone logic to avoid noise.
+        Implements dead zone logic to avoid noise, then a majority vote over
+        recent samples so jitter around the dead zone does not flap the
+        command between STOP and a move.
         
         Args:
             orientation: Current watch orientation
         
         Returns:
-            MotionCommand if significant movement detected, None for neutral
+            MotionCommand once enough samples agree, None before any has
         """
-        roll = orientation.roll
-        pitch = orientation.pitch
-        
-        # Calculate magnitude to check dead zone
-        abs_roll = abs(roll)
-        abs_pitch = abs(pitch)
-        
-        # Check dead zone threshold
-        if abs_roll < self.config.dead_zone_threshold and abs_pitch < self.config.dead_zone_threshold:
-            return MotionCommand.STOP
-        
-        # Determine which direction is stronger
-        if abs_roll > abs_pitch:
-            # Roll is dominant (left-right tilt)
-            if roll < -self.config.dead_zone_threshold:
-                return MotionCommand.MOVE_LEFT
-            elif roll > self.config.dead_zone_threshold:
-                return MotionCommand.MOVE_RIGHT
-        else:
-            # Pitch is dominant (forward-backward tilt)
-            if pitch > self.config.dead_zone_threshold:
-                return MotionCommand.MOVE_FORWARD
-            elif pitch < -self.config.dead_zone_threshold:
-                return MotionCommand.MOVE_BACKWARD
-        
-        return MotionCommand.STOP
+        candidate = self._classify_orientation(orientation)
+        
+        votes = self._vote_buffer
+        votes.append(candidate)
+        
+        if candidate is not self._committed_motion:
+            if candidate is STOP:
+                needed = self.config.stop_vote_threshold
+            else:
+                needed = self.config.motion_vote_threshold
+            if votes.count(candidate) >= needed:
+                self._committed_motion = candidate
+        
+        return self._committed_motion
+    
+    def _classify_orientation(self, orientation: WatchOrientation) -> MotionCommand:
+        """Map a single orientation sample to a motion command."""
+        dz = self.config.dead_zone_threshold
+        r = orientation.roll
+        p = orientation.pitch
+        ar = -r if r < 0 else r
+        ap = -p if p < 0 else p
+        
+        # Pick the dominant axis, then a single dead-zone compare on its
+        # magnitude (the common at-rest case returns STOP right here)
+        if ar > ap:
+            # Roll dominant -> left/right
+            if ar <= dz:
+                return STOP
+            return _ROLL_TABLE[r > 0]
+        
+        # Pitch dominant -> forward/backward
+        if ap <= dz:
+            return STOP
+        return _PITCH_TABLE[p > 0]
     
     def interpret_gesture(self, gesture: WatchGesture) -> 'ActionCommand | None':
         """
@@ -82,17 +115,17 @@ class WatchInterpreter:
         
         # Check debounce window
         if time_since_last < self.config.gesture_debounce_ms:
-            self.logger.debug(
+            self.logger.debug_lazy(
                 "gesture",
-                f"Gesture {gesture.gesture_type} ignored (debounce)"
+                lambda: f"Gesture {gesture.gesture_type} ignored (debounce)"
             )
             return None
         
         self._last_gesture_time = current_time
         
         # Map gesture types to actions
-        if gesture.gesture_type.lower() in ("tap", "double_tap"):
-            return ActionCommand.PICKUP
+        if gesture.gesture_type in _PICKUP_GESTURES:
+            return PICKUP
         
         return None
     
@@ -109,7 +142,7 @@ class WatchInterpreter:
         Returns:
             True if command changed, False if it's the same
         """
-        if new_motion != self._last_motion_command:
+        if new_motion is not self._last_motion_command:
             self._last_motion_command = new_motion
             return True
         return False
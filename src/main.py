@@ -6,12 +6,7 @@ Main entry point for the application.
 
 import sys
 import argparse
-import os
-
-# Add project root to path for imports
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import traceback
 
 from src.config import get_default_config
 from src.inputs.mock_watch import MockWatchInput
@@ -22,11 +17,34 @@ from src.controller.manual_controller import ManualController
 from src.utils.logger import Logger
 
 
-def create_app(mock_mode: bool = False, verbose: bool = False):
+# The CLI shape is fixed, so the parser is built once at import
+_PARSER = argparse.ArgumentParser(
+    description="Manual control subsystem for LeKiwi + SO-101 robot"
+)
+_PARSER.add_argument(
+    "--mock",
+    action="store_true",
+    default=False,
+    help="Run in mock/dry-run mode",
+)
+_PARSER.add_argument(
+    "--verbose",
+    "-v",
+    action="store_true",
+    help="Enable verbose logging",
+)
+_PARSER.add_argument(
+    "--realtime",
+    action="store_true",
+    help="Request real-time scheduling priority for the control loop",
+)
+
+
+def create_app(mock_mode: bool = False, verbose: bool = False, realtime: bool = False):
     """
     Create and initialize the application.
     """
-    config = get_default_config(mock_mode=mock_mode, verbose=verbose)
+    config = get_default_config(mock_mode=mock_mode, verbose=verbose, realtime=realtime)
     logger = Logger("ManualControl", verbose=verbose)
 
     if mock_mode:
@@ -53,26 +71,14 @@ def create_app(mock_mode: bool = False, verbose: bool = False):
 
 def main():
     """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Manual control subsystem for LeKiwi + SO-101 robot"
-    )
-    parser.add_argument(
-        "--mock",
-        action="store_true",
-        default=False,
-        help="Run in mock/dry-run mode",
-    )
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Enable verbose logging",
-    )
-
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     try:
-        controller, logger = create_app(mock_mode=args.mock, verbose=args.verbose)
+        controller, logger = create_app(
+            mock_mode=args.mock,
+            verbose=args.verbose,
+            realtime=args.realtime,
+        )
 
         logger.info("main", "=" * 60)
         logger.info("main", "Manual Control System Starting")
@@ -99,7 +105,6 @@ def main():
         return 0
     except Exception as e:
         print(f"FATAL ERROR: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
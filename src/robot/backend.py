@@ -2,15 +2,20 @@
 Robot backend interfaces and implementations.
 """
 
-from abc import ABC, abstractmethod
+from typing import Protocol
+
 from src.utils.commands import MotionCommand, ActionCommand
 from src.utils.logger import Logger
 
 
-class RobotBackend(ABC):
-    """Abstract base class for robot backends."""
+class RobotBackend(Protocol):
+    """
+    Interface for robot backends.
+    
+    Structural: any class with these methods is a RobotBackend, no
+    subclassing required.
+    """
     
-    @abstractmethod
     def execute_motion(self, command: MotionCommand) -> None:
         """
         Execute a motion command.
@@ -20,7 +25,6 @@ class RobotBackend(ABC):
         """
         pass
     
-    @abstractmethod
     def execute_action(self, command: ActionCommand) -> None:
         """
         Execute an action command.
@@ -30,24 +34,36 @@ class RobotBackend(ABC):
         """
         pass
     
-    @abstractmethod
     def stop_all(self) -> None:
         """Stop all motion and actions immediately."""
         pass
     
-    @abstractmethod
     def shutdown(self) -> None:
         """Cleanly shutdown the robot backend."""
         pass
 
 
-class MockRobotBackend(RobotBackend):
+class MockRobotBackend:
     """
     Mock robot backend that prints commands to console.
     
     Used for local laptop testing without real hardware.
     """
     
+    __slots__ = ("logger", "_stopped", "_last_motion")
+    
+    _MOTION_MESSAGES = {
+        MotionCommand.MOVE_FORWARD: "🤖 driving forward",
+        MotionCommand.MOVE_BACKWARD: "🤖 driving backward",
+        MotionCommand.MOVE_LEFT: "🤖 driving left",
+        MotionCommand.MOVE_RIGHT: "🤖 driving right",
+        MotionCommand.STOP: "🤖 stopping base",
+    }
+    
+    _ACTION_MESSAGES = {
+        ActionCommand.PICKUP: "🤖 ACT policy activated (pickup)",
+    }
+    
     def __init__(self, logger: Logger):
         """
         Initialize mock backend.
@@ -57,27 +73,33 @@ class MockRobotBackend(RobotBackend):
         """
         self.logger = logger
         self._stopped = False
+        self._last_motion: 'MotionCommand | None' = None
     
     def execute_motion(self, command: MotionCommand) -> None:
         """Print motion command."""
-        if command == MotionCommand.MOVE_FORWARD:
-            self.logger.info("robot", "🤖 driving forward", suppress_duplicate=True)
-        elif command == MotionCommand.MOVE_BACKWARD:
-            self.logger.info("robot", "🤖 driving backward", suppress_duplicate=True)
-        elif command == MotionCommand.MOVE_LEFT:
-            self.logger.info("robot", "🤖 driving left", suppress_duplicate=True)
-        elif command == MotionCommand.MOVE_RIGHT:
-            self.logger.info("robot", "🤖 driving right", suppress_duplicate=True)
-        elif command == MotionCommand.STOP:
-            self.logger.info("robot", "🤖 stopping base", suppress_duplicate=True)
+        if self._stopped:
+            return
+        
+        # Repeating the motion already in progress is a no-op
+        if command is self._last_motion:
+            return
+        self._last_motion = command
+        
+        msg = self._MOTION_MESSAGES.get(command)
+        if msg is not None:
+            self.logger.info("robot", msg, suppress_duplicate=True)
     
     def execute_action(self, command: ActionCommand) -> None:
         """Print action command."""
-        if command == ActionCommand.PICKUP:
-            self.logger.info("robot", "🤖 ACT policy activated (pickup)")
+        if self._stopped:
+            return
+        
+        msg = self._ACTION_MESSAGES.get(command)
+        if msg is not None:
+            self.logger.info("robot", msg)
     
     def stop_all(self) -> None:
-        """Stop all motion."""
+        """Stop all motion and ignore any further commands."""
         self._stopped = True
         self.logger.info("robot", "🤖 emergency stop engaged")
     
@@ -3,7 +3,17 @@ Utility module - exports common utilities.
 """
 
 from src.utils.logger import Logger, LogLevel
-from src.utils.commands import MotionCommand, ActionCommand, RobotCommand
+from src.utils.commands import (
+    MotionCommand,
+    ActionCommand,
+    RobotCommand,
+    MOVE_FORWARD,
+    MOVE_BACKWARD,
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    STOP,
+    PICKUP,
+)
 
 __all__ = [
     "Logger",
@@ -11,4 +21,10 @@ __all__ = [
     "MotionCommand",
     "ActionCommand",
     "RobotCommand",
+    "MOVE_FORWARD",
+    "MOVE_BACKWARD",
+    "MOVE_LEFT",
+    "MOVE_RIGHT",
+    "STOP",
+    "PICKUP",
 ]
@@ -3,6 +3,7 @@ Command definitions for the manual control system.
 """
 
 from enum import Enum, auto
+from typing import NamedTuple
 
 
 class MotionCommand(Enum):
@@ -21,16 +22,36 @@ class ActionCommand(Enum):
     PICKUP = auto()
 
 
-class RobotCommand:
+# Module-level aliases so hot paths can use a single global lookup
+MOVE_FORWARD = MotionCommand.MOVE_FORWARD
+MOVE_BACKWARD = MotionCommand.MOVE_BACKWARD
+MOVE_LEFT = MotionCommand.MOVE_LEFT
+MOVE_RIGHT = MotionCommand.MOVE_RIGHT
+STOP = MotionCommand.STOP
+PICKUP = ActionCommand.PICKUP
+
+
+class _RobotCommandFields(NamedTuple):
+    """Field layout of RobotCommand."""
+    
+    motion: 'MotionCommand | None' = None
+    action: 'ActionCommand | None' = None
+
+
+class RobotCommand(_RobotCommandFields):
     """
     Represents a complete command to the robot.
     
     A command can be either a motion command or an action command.
+    Immutable: a tuple of (motion, action), so equality and hashing are
+    plain tuple operations.
     """
     
-    def __init__(self, motion: 'MotionCommand | None' = None, action: 'ActionCommand | None' = None):
+    __slots__ = ()
+    
+    def __new__(cls, motion: 'MotionCommand | None' = None, action: 'ActionCommand | None' = None):
         """
-        Initialize a robot command.
+        Create a robot command.
         
         Args:
             motion: Motion command, or None if only action
@@ -39,13 +60,7 @@ class RobotCommand:
         if motion is None and action is None:
             raise ValueError("At least one of motion or action must be provided")
         
-        self.motion = motion
-        self.action = action
-    
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, RobotCommand):
-            return NotImplemented
-        return self.motion == other.motion and self.action == other.action
+        return super().__new__(cls, motion, action)
     
     def __repr__(self) -> str:
         parts = []
@@ -65,4 +80,4 @@ class RobotCommand:
     
     def is_motion_stop(self) -> bool:
         """Check if this is a stop command."""
-        return self.motion == MotionCommand.STOP
+        return self.motion is STOP
@@ -3,11 +3,13 @@ Logger utility for clean, non-noisy logging.
 """
 
 import sys
-from datetime import datetime
-from enum import Enum
+import time
+from collections import OrderedDict
+from enum import IntEnum
+from typing import Callable
 
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     """Log levels."""
     DEBUG = 0
     INFO = 1
@@ -18,22 +20,63 @@ class LogLevel(Enum):
 class Logger:
     """Simple logger that avoids noisy repeated messages."""
     
+    __slots__ = (
+        "name", "verbose", "min_level",
+        "_debug_enabled", "_info_enabled", "_warning_enabled", "_error_enabled",
+        "_last_messages", "_prefix_cache", "_ts_cache_key", "_ts_cache_val",
+    )
+    
+    # Max categories remembered for duplicate suppression
+    MAX_TRACKED_CATEGORIES = 64
+    
     def __init__(self, name: str, verbose: bool = False):
         self.name = name
         self.verbose = verbose
         self.min_level = LogLevel.DEBUG if verbose else LogLevel.INFO
-        self._last_messages: dict[str, str] = {}
+        
+        # Level gates, checked first thing in every log call
+        self._debug_enabled = self.min_level <= LogLevel.DEBUG
+        self._info_enabled = self.min_level <= LogLevel.INFO
+        self._warning_enabled = self.min_level <= LogLevel.WARNING
+        self._error_enabled = self.min_level <= LogLevel.ERROR
+        
+        # Last suppress_duplicate message per category, least recently used first
+        self._last_messages: OrderedDict[str, str] = OrderedDict()
+        self._prefix_cache: dict[tuple[LogLevel, str], str] = {}
+        
+        # Formatted timestamp for the millisecond in _ts_cache_key
+        self._ts_cache_key = 0
+        self._ts_cache_val = ""
     
     def _format_message(self, level: LogLevel, category: str, message: str) -> str:
         """Format a log message with timestamp and level."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        level_str = level.name.upper()
-        return f"[{timestamp}] [{level_str}] [{self.name}:{category}] {message}"
+        # Bursts of log calls within one millisecond share one strftime
+        t = time.time()
+        key = int(t * 1000)
+        if key != self._ts_cache_key:
+            self._ts_cache_val = time.strftime("%H:%M:%S", time.localtime(t)) + f".{key % 1000:03d}"
+            self._ts_cache_key = key
+        timestamp = self._ts_cache_val
+        
+        # The "[LEVEL] [name:category]" part only depends on level and category
+        prefix = self._prefix_cache.get((level, category))
+        if prefix is None:
+            prefix = f"[{level.name}] [{self.name}:{category}]"
+            self._prefix_cache[(level, category)] = prefix
+        
+        return f"[{timestamp}] {prefix} {message}"
     
     def debug(self, category: str, message: str) -> None:
         """Log a debug message."""
-        if self.min_level.value <= LogLevel.DEBUG.value:
-            print(self._format_message(LogLevel.DEBUG, category, message))
+        if not self._debug_enabled:
+            return
+        sys.stdout.write(self._format_message(LogLevel.DEBUG, category, message) + "\n")
+    
+    def debug_lazy(self, category: str, msg_fn: Callable[[], str]) -> None:
+        """Log a debug message built by msg_fn, called only if debug is enabled."""
+        if not self._debug_enabled:
+            return
+        sys.stdout.write(self._format_message(LogLevel.DEBUG, category, msg_fn()) + "\n")
     
     def info(self, category: str, message: str, suppress_duplicate: bool = False) -> None:
         """
@@ -42,23 +85,32 @@ class Logger:
         Args:
             category: Message category for grouping
             message: Message to log
-            suppress_duplicate: If True, don't log if same message was just logged
+            suppress_duplicate: If True, don't log if this is the same message
+                as the previous suppress_duplicate one in this category
         """
-        if self.min_level.value <= LogLevel.INFO.value:
-            if suppress_duplicate:
-                key = f"{category}:{message}"
-                if key in self._last_messages and self._last_messages[key] == message:
-                    return
-                self._last_messages[key] = message
-            
-            print(self._format_message(LogLevel.INFO, category, message))
+        if not self._info_enabled:
+            return
+        
+        if suppress_duplicate:
+            last_messages = self._last_messages
+            if last_messages.get(category) == message:
+                last_messages.move_to_end(category)
+                return
+            last_messages[category] = message
+            last_messages.move_to_end(category)
+            if len(last_messages) > self.MAX_TRACKED_CATEGORIES:
+                last_messages.popitem(last=False)
+        
+        sys.stdout.write(self._format_message(LogLevel.INFO, category, message) + "\n")
     
     def warning(self, category: str, message: str) -> None:
         """Log a warning message."""
-        if self.min_level.value <= LogLevel.WARNING.value:
-            print(self._format_message(LogLevel.WARNING, category, message), file=sys.stderr)
+        if not self._warning_enabled:
+            return
+        sys.stderr.write(self._format_message(LogLevel.WARNING, category, message) + "\n")
     
     def error(self, category: str, message: str) -> None:
         """Log an error message."""
-        if self.min_level.value <= LogLevel.ERROR.value:
-            print(self._format_message(LogLevel.ERROR, category, message), file=sys.stderr)
+        if not self._error_enabled:
+            return
+        sys.stderr.write(self._format_message(LogLevel.ERROR, category, message) + "\n")
@@ -0,0 +1,69 @@
+"""
+Optional OS scheduling tweaks for a lower-jitter control loop.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator
+
+# Windows process priority class (winbase.h)
+_HIGH_PRIORITY_CLASS = 0x00000080
+
+
+def enable_realtime(priority: int = 20) -> bool:
+    """
+    Raise the scheduling priority of the calling thread.
+    
+    Linux: SCHED_FIFO at the given priority (needs CAP_SYS_NICE or root).
+    Only the calling thread and threads it starts afterwards are affected,
+    so call it from the control-loop thread once other threads are running.
+    Windows: HIGH_PRIORITY_CLASS, which applies to the whole process
+    (see windows_high_res_timer for timer resolution).
+    Other platforms are left untouched.
+    
+    Args:
+        priority: SCHED_FIFO priority on Linux (1-99)
+    
+    Returns:
+        True if the priority was raised, False if unsupported or not permitted
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            return True
+        
+        if sys.platform == "win32":
+            import ctypes
+            
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), _HIGH_PRIORITY_CLASS))
+    except (OSError, AttributeError):
+        pass
+    
+    return False
+
+
+@contextmanager
+def windows_high_res_timer(period_ms: int = 1) -> Iterator[None]:
+    """
+    Raise the Windows system timer resolution for the duration of the block.
+    
+    The default ~15.6 ms tick rounds up every time.sleep(); this lets short
+    poll intervals actually be honoured. No-op on other platforms.
+    
+    Args:
+        period_ms: Requested timer resolution in milliseconds
+    """
+    if sys.platform != "win32":
+        yield
+        return
+    
+    import ctypes
+    
+    winmm = ctypes.WinDLL("winmm")
+    winmm.timeBeginPeriod(period_ms)
+    try:
+        yield
+    finally:
+        winmm.timeEndPeriod(period_ms)
@@ -4,15 +4,27 @@ Test script for manual control system.
 Runs the system for a brief period and demonstrates functionality.
 """
 
+import io
+import math
 import sys
-import os
 import time
 import threading
+from contextlib import redirect_stdout
+from types import SimpleNamespace
 
-# Add project root to path
-sys.path.insert(0, '/Users/deepanker/Desktop/robotics_hackathon_2')
-
+from src.config import WatchInputConfig
+from src.inputs import doublepoint_watch
+from src.inputs._accel_kernel import accel_to_roll_pitch
+from src.inputs.watch_input import WatchOrientation
+from src.interpreter.watch_interpreter import WatchInterpreter
 from src.main import create_app
+from src.robot.backend import MockRobotBackend
+from src.utils.commands import MOVE_FORWARD, MOVE_LEFT, STOP
+from src.utils.logger import Logger
+
+
+# Enough polls for the interpreter's motion vote to settle on a new pose
+TICKS_PER_POSE = 8
 
 
 def test_mock_mode():
@@ -37,15 +49,18 @@ def test_mock_mode():
         # Inject orientation to trigger commands
         print("\n--- Simulating forward tilt ---")
         watch.inject_orientation(roll=0, pitch=30)
-        controller._process_watch_data()
+        for _ in range(TICKS_PER_POSE):
+            controller._process_watch_data()
         
         print("\n--- Simulating left tilt ---")
         watch.inject_orientation(roll=-30, pitch=0)
-        controller._process_watch_data()
+        for _ in range(TICKS_PER_POSE):
+            controller._process_watch_data()
         
         print("\n--- Simulating stop (neutral) ---")
         watch.inject_orientation(roll=0, pitch=0)
-        controller._process_watch_data()
+        for _ in range(TICKS_PER_POSE):
+            controller._process_watch_data()
         
         print("\n--- Simulating gesture tap ---")
         watch.inject_gesture("tap")
@@ -64,6 +79,170 @@ def test_mock_mode():
         return False
 
 
+def _feed(interpreter, roll, pitch, n):
+    """Feed n identical orientation samples, returning the command after each."""
+    orientation = WatchOrientation(roll=roll, pitch=pitch)
+    return [interpreter.interpret_orientation(orientation) for _ in range(n)]
+
+
+def test_motion_vote():
+    """Check how many samples the motion vote needs to move and to stop."""
+    config = WatchInputConfig()
+    window = config.motion_vote_window
+    move_n = config.motion_vote_threshold
+    stop_n = config.stop_vote_threshold
+    interpreter = WatchInterpreter(config, Logger("test"))
+    
+    # From a fresh start, nothing is commanded until move_n samples agree
+    out = _feed(interpreter, 0, 30, move_n)
+    assert out == [None] * (move_n - 1) + [MOVE_FORWARD], out
+    
+    # Stopping from a settled move takes stop_n samples
+    _feed(interpreter, 0, 30, window)
+    out = _feed(interpreter, 0, 0, stop_n)
+    assert out == [MOVE_FORWARD] * (stop_n - 1) + [STOP], out
+    
+    # Moving again from a settled stop takes move_n samples
+    _feed(interpreter, 0, 0, window)
+    out = _feed(interpreter, -30, 0, move_n)
+    assert out == [STOP] * (move_n - 1) + [MOVE_LEFT], out
+    
+    # Jitter alternating between neutral and a tilt must not start a move
+    _feed(interpreter, 0, 0, window)
+    out = []
+    for _ in range(window):
+        out += _feed(interpreter, 30, 0, 1)
+        out += _feed(interpreter, 0, 0, 1)
+    assert all(cmd is STOP for cmd in out), out
+    
+    # Thresholds the window can never reach are rejected up front
+    for bad in ({"motion_vote_threshold": window + 1}, {"stop_vote_threshold": 0}):
+        try:
+            WatchInputConfig(**bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"WatchInputConfig accepted {bad}")
+
+
+def test_duplicate_motion_logging():
+    """A repeated motion is logged once; returning to an earlier one logs it again."""
+    logger = Logger("test")
+    
+    # Logger level: forward, forward, left, forward -> three lines
+    out = io.StringIO()
+    with redirect_stdout(out):
+        for message in ("forward", "forward", "left", "forward"):
+            logger.info("robot", message, suppress_duplicate=True)
+    lines = [line.rsplit(" ", 1)[-1] for line in out.getvalue().splitlines()]
+    assert lines == ["forward", "left", "forward"], lines
+    
+    # Same sequence through the mock backend
+    backend = MockRobotBackend(logger)
+    out = io.StringIO()
+    with redirect_stdout(out):
+        for command in (MOVE_FORWARD, MOVE_FORWARD, MOVE_LEFT, MOVE_FORWARD):
+            backend.execute_motion(command)
+    lines = [line.rsplit(" ", 1)[-1] for line in out.getvalue().splitlines()]
+    assert lines == ["forward", "left", "forward"], lines
+
+
+def _first(obj, *names):
+    """Value of the first of names present on obj (dict key or attribute), else None."""
+    for name in names:
+        if isinstance(obj, dict):
+            if name in obj:
+                return obj[name]
+        elif hasattr(obj, name):
+            return getattr(obj, name)
+    return None
+
+
+def _reference_orientation(sensors):
+    """Uncached roll/pitch extraction in the original priority order."""
+    roll, pitch = _first(sensors, "roll"), _first(sensors, "pitch")
+    if roll is not None and pitch is not None:
+        return float(roll), float(pitch)
+    
+    q = _first(sensors, "orientation", "quaternion")
+    if isinstance(q, (list, tuple)) and len(q) == 4:
+        parts = list(q)
+    elif q is not None:
+        parts = [_first(q, *names) for names in (("w", "qw", "q0"), ("x", "qx", "q1"), ("y", "qy", "q2"), ("z", "qz", "q3"))]
+    else:
+        parts = [None]
+    if None not in parts:
+        return doublepoint_watch._quat_to_roll_pitch_deg(*map(float, parts))
+    
+    accel = _first(sensors, "accel", "accelerometer")
+    if accel is not None:
+        parts = [_first(accel, *names) for names in (("x", "ax"), ("y", "ay"), ("z", "az"))]
+        if None not in parts:
+            return accel_to_roll_pitch(*map(float, parts))
+    return None
+
+
+def test_orientation_layout_priority():
+    """The cached payload layout must pick the same source as the uncached probe order."""
+    ns = SimpleNamespace
+    quat = {"w": 0.95, "x": 0.17, "y": 0.15, "z": 0.2}
+    accel = {"x": 0.1, "y": 0.3, "z": 0.9}
+    sequences = {
+        # Quaternion not streaming yet, accelerometer already there
+        "object warm-up": [
+            ns(orientation=None, accel=ns(**accel)),
+            ns(orientation=ns(**quat), accel=ns(**accel)),
+            ns(orientation=None, accel=ns(**accel)),
+            ns(orientation=ns(**quat), accel=ns(**accel)),
+        ],
+        # Higher-priority fields appearing on a type cached from a poorer payload
+        "object mixed": [
+            ns(accel=ns(**accel)),
+            ns(orientation=ns(**quat), accel=ns(**accel)),
+            ns(orientation=ns(**quat)),
+            ns(roll=5.0, pitch=-7.0, orientation=ns(**quat)),
+            ns(roll=None, pitch=-7.0, orientation=ns(**quat)),
+        ],
+        "dict mixed": [
+            {"accelerometer": {"ax": 0.2, "ay": 0.1, "az": 0.95}},
+            {"quaternion": [0.95, 0.17, 0.15, 0.2], "accel": accel},
+            {"orientation": None, "accel": accel},
+            {"orientation": {"qw": 0.9, "qx": 0.3, "qy": 0.1, "qz": 0.3}},
+            {"roll": 12.0, "pitch": 3.0, "quaternion": [1.0, 0.0, 0.0, 0.0]},
+            {"quaternion": [1.0, 0.0, 0.0, 0.0]},
+            {"orientation": {"w": None, "x": 0.0, "y": 0.0, "z": 0.0}, "accel": accel},
+        ],
+    }
+    
+    for label, payloads in sequences.items():
+        doublepoint_watch._SENSOR_ACCESSOR_CACHE.clear()
+        # Twice, so the second pass runs against a warm cache
+        for payload in payloads * 2:
+            got = doublepoint_watch._extract_orientation(payload)
+            want = _reference_orientation(payload)
+            same = got == want or (
+                got is not None and want is not None
+                and all(math.isclose(a, b) for a, b in zip(got, want))
+            )
+            assert same, f"{label}: {payload!r} -> {got}, expected {want}"
+
+
+def run_checks():
+    """Run the assertion-based checks, reporting each one."""
+    ok = True
+    for check in (test_motion_vote, test_duplicate_motion_logging, test_orientation_layout_priority):
+        try:
+            check()
+            print(f"✓ {check.__name__}")
+        except AssertionError:
+            print(f"✗ {check.__name__} failed")
+            import traceback
+            traceback.print_exc()
+            ok = False
+    return ok
+
+
 if __name__ == "__main__":
     success = test_mock_mode()
+    success = run_checks() and success
     sys.exit(0 if success else 1)
@@ -1,3 +1,4 @@
+import math
 import time
 
 from src.inputs.doublepoint_watch import DoublepointWatchInput
@@ -17,28 +18,41 @@ def main():
     print("Press Ctrl+C to exit.")
     print("")
 
-    last_roll = None
-    last_pitch = None
+    # NaN until the first orientation is printed
+    last_roll = last_pitch = float("nan")
+
+    # Poll quickly while events are arriving, back off toward 50 ms when idle
+    min_interval = 0.005
+    max_interval = 0.05
+    interval = min_interval
 
     try:
         while True:
             watch.poll()
+            got_event = False
 
             orientation = watch.get_orientation()
             if orientation is not None:
-                roll_changed = last_roll is None or abs(orientation.roll - last_roll) >= 3.0
-                pitch_changed = last_pitch is None or abs(orientation.pitch - last_pitch) >= 3.0
+                # Print when the tilt moved at least 3 degrees since the last print
+                dr = orientation.roll - last_roll
+                dp = orientation.pitch - last_pitch
 
-                if roll_changed or pitch_changed:
+                if math.isnan(last_roll) or dr * dr + dp * dp >= 9.0:
                     print(f"orientation: roll={orientation.roll:.1f}, pitch={orientation.pitch:.1f}")
                     last_roll = orientation.roll
                     last_pitch = orientation.pitch
+                    got_event = True
 
             gesture = watch.get_gesture()
             if gesture is not None:
                 print(f"gesture: {gesture.gesture_type}")
+                got_event = True
 
-            time.sleep(0.05)
+            if got_event:
+                interval = min_interval
+            else:
+                interval = min(interval * 1.5, max_interval)
+            time.sleep(interval)
 
     except KeyboardInterrupt:
         print("\nStopping...")